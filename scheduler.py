@@ -8,10 +8,15 @@ Alternative: Use cron or systemd timers instead.
 
 import schedule
 import time
-import subprocess
 import sys
 from pathlib import Path
 
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.pipeline import run_pipeline
+import config
+
 
 # How often to run (in hours)
 RUN_INTERVAL_HOURS = 1
@@ -23,16 +28,23 @@ def run_curator():
     print(f"Running curator at {time.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'=' * 50}\n")
 
-    curator_path = Path(__file__).parent / "curator.py"
+    if not config.ANTHROPIC_API_KEY:
+        print("Error: ANTHROPIC_API_KEY environment variable not set")
+        return
 
+    # Run in-process; one bad run shouldn't stop the scheduler
     try:
-        result = subprocess.run(
-            [sys.executable, str(curator_path)],
-            cwd=str(curator_path.parent),
-            capture_output=False
+        run_pipeline(
+            api_key=config.ANTHROPIC_API_KEY,
+            feeds=config.RSS_FEEDS,
+            db_path=config.DB_PATH,
+            silverbullet_space=config.SILVERBULLET_SPACE,
+            model=config.CLAUDE_MODEL,
+            style_guide=config.CONTENT_STYLE,
+            score_high=config.SCORE_HIGH,
+            score_medium=config.SCORE_MEDIUM,
+            max_articles=config.MAX_ARTICLES_PER_RUN
         )
-        if result.returncode != 0:
-            print(f"Curator exited with code {result.returncode}")
     except Exception as e:
         print(f"Error running curator: {e}")
 
@@ -50,7 +62,9 @@ def main():
 
     while True:
         schedule.run_pending()
-        time.sleep(60)  # Check every minute
+        # Sleep until the next run is due instead of waking every minute
+        idle = schedule.idle_seconds()
+        time.sleep(max(idle, 0) if idle is not None else 60)
 
 
 if __name__ == "__main__":
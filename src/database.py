@@ -3,124 +3,187 @@
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-import hashlib
+
+
+SQLITE_MAX_VARIABLES = 999
 
 
 def get_connection(db_path: Path) -> sqlite3.Connection:
-    """Get database connection, creating tables if needed."""
+    """
+    Get database connection, creating tables if needed.
+
+    Write helpers don't commit; callers group writes with `with conn:`.
+    """
     db_path.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
+    conn.executescript("""
+        PRAGMA journal_mode = WAL;
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA mmap_size = 268435456;
+        PRAGMA cache_size = -65536;
+    """)
     _init_tables(conn)
     return conn
 
 
+_ARTICLES_TABLE = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        url TEXT UNIQUE NOT NULL,
+        title TEXT NOT NULL,
+        source TEXT,
+        published_at TEXT,
+        fetched_at TEXT NOT NULL,
+        score REAL,
+        score_reason TEXT,
+        status TEXT DEFAULT 'new',
+        tweet TEXT,
+        thread TEXT,
+        linkedin TEXT,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+
+_CONTENT_TYPES = ("tweet", "thread", "linkedin")
+
+
 def _init_tables(conn: sqlite3.Connection) -> None:
     """Initialize database tables."""
-    conn.executescript("""
-        CREATE TABLE IF NOT EXISTS articles (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            url_hash TEXT UNIQUE NOT NULL,
-            url TEXT NOT NULL,
-            title TEXT NOT NULL,
-            source TEXT,
-            published_at TEXT,
-            fetched_at TEXT NOT NULL,
-            score REAL,
-            score_reason TEXT,
-            status TEXT DEFAULT 'new',
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP
-        );
-
-        CREATE TABLE IF NOT EXISTS generated_content (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            article_id INTEGER NOT NULL,
-            content_type TEXT NOT NULL,
-            content TEXT NOT NULL,
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (article_id) REFERENCES articles(id)
+    _drop_url_hash(conn)
+    _merge_generated_content(conn)
+    conn.executescript(_ARTICLES_TABLE.format(name="articles") + """
+        CREATE TABLE IF NOT EXISTS feed_cache (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            body_hash TEXT,
+            fetched_at TEXT
         );
 
-        CREATE INDEX IF NOT EXISTS idx_articles_url_hash ON articles(url_hash);
-        CREATE INDEX IF NOT EXISTS idx_articles_status ON articles(status);
+        DROP INDEX IF EXISTS idx_articles_status;
+        CREATE INDEX IF NOT EXISTS idx_articles_status_score
+            ON articles(status, score DESC, created_at DESC);
         CREATE INDEX IF NOT EXISTS idx_articles_score ON articles(score);
     """)
     conn.commit()
 
 
-def url_hash(url: str) -> str:
-    """Generate hash for URL deduplication."""
-    return hashlib.sha256(url.encode()).hexdigest()[:16]
+def _drop_url_hash(conn: sqlite3.Connection) -> None:
+    """Rebuild articles from older databases without the url_hash column."""
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(articles)")}
+    if "url_hash" not in columns:
+        return
 
-
-def article_exists(conn: sqlite3.Connection, url: str) -> bool:
-    """Check if article URL has been processed."""
-    cursor = conn.execute(
-        "SELECT 1 FROM articles WHERE url_hash = ?",
-        (url_hash(url),)
-    )
-    return cursor.fetchone() is not None
-
-
-def insert_article(
-    conn: sqlite3.Connection,
-    url: str,
-    title: str,
-    source: str,
-    published_at: Optional[str] = None
-) -> int:
-    """Insert new article, return ID."""
-    cursor = conn.execute(
-        """INSERT INTO articles (url_hash, url, title, source, published_at, fetched_at)
-           VALUES (?, ?, ?, ?, ?, ?)""",
-        (url_hash(url), url, title, source, published_at, datetime.utcnow().isoformat())
-    )
-    conn.commit()
-    return cursor.lastrowid
-
-
-def update_score(
-    conn: sqlite3.Connection,
-    article_id: int,
-    score: float,
-    reason: str,
-    status: str
-) -> None:
-    """Update article score and status."""
-    conn.execute(
-        """UPDATE articles SET score = ?, score_reason = ?, status = ? WHERE id = ?""",
-        (score, reason, status, article_id)
-    )
-    conn.commit()
+    copied = ", ".join(sorted(columns - {"url_hash"}))
+    conn.executescript("BEGIN;" + _ARTICLES_TABLE.format(name="articles_new") + f"""
+        INSERT INTO articles_new ({copied}) SELECT {copied} FROM articles;
+        DROP TABLE articles;
+        ALTER TABLE articles_new RENAME TO articles;
+        COMMIT;
+    """)
 
 
-def insert_content(
-    conn: sqlite3.Connection,
-    article_id: int,
-    content_type: str,
-    content: str
-) -> int:
-    """Insert generated content for an article."""
-    cursor = conn.execute(
-        """INSERT INTO generated_content (article_id, content_type, content)
-           VALUES (?, ?, ?)""",
-        (article_id, content_type, content)
+def _merge_generated_content(conn: sqlite3.Connection) -> None:
+    """Move content from the old generated_content table onto articles."""
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(articles)")}
+    if not columns:
+        return
+
+    script = "BEGIN;"
+    for content_type in _CONTENT_TYPES:
+        if content_type not in columns:
+            script += f"ALTER TABLE articles ADD COLUMN {content_type} TEXT;"
+
+    has_table = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'generated_content'"
+    ).fetchone()
+    if has_table:
+        for content_type in _CONTENT_TYPES:
+            script += f"""
+                UPDATE articles SET {content_type} = (
+                    SELECT content FROM generated_content
+                    WHERE article_id = articles.id AND content_type = '{content_type}'
+                );"""
+        script += "DROP TABLE generated_content;"
+
+    if script != "BEGIN;":
+        conn.executescript(script + "COMMIT;")
+
+
+def get_existing_urls(conn: sqlite3.Connection, urls: list[str]) -> set[str]:
+    """Return the subset of URLs that have already been processed."""
+    existing = set()
+    # Stay under SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds
+    for start in range(0, len(urls), SQLITE_MAX_VARIABLES):
+        chunk = urls[start:start + SQLITE_MAX_VARIABLES]
+        cursor = conn.execute(
+            f"SELECT url FROM articles WHERE url IN ({','.join('?' * len(chunk))})",
+            chunk
+        )
+        existing.update(row["url"] for row in cursor)
+    return existing
+
+
+def insert_articles_bulk(conn: sqlite3.Connection, rows: list[dict]) -> None:
+    """
+    Insert many processed articles, with their scores and content, at once.
+
+    Args:
+        rows: Dicts with url, title, source, published_at, score, score_reason,
+            status, tweet, thread and linkedin keys
+    """
+    fetched_at = datetime.utcnow().isoformat()
+    conn.executemany(
+        """INSERT INTO articles (
+               url, title, source, published_at, fetched_at,
+               score, score_reason, status, tweet, thread, linkedin
+           ) VALUES (
+               :url, :title, :source, :published_at, :fetched_at,
+               :score, :score_reason, :status, :tweet, :thread, :linkedin
+           )""",
+        [{**row, "fetched_at": fetched_at} for row in rows]
     )
-    conn.commit()
-    return cursor.lastrowid
 
 
 def get_articles_by_status(conn: sqlite3.Connection, status: str) -> list[dict]:
     """Get all articles with given status."""
     cursor = conn.execute(
-        """SELECT a.*,
-                  (SELECT content FROM generated_content WHERE article_id = a.id AND content_type = 'tweet') as tweet,
-                  (SELECT content FROM generated_content WHERE article_id = a.id AND content_type = 'thread') as thread,
-                  (SELECT content FROM generated_content WHERE article_id = a.id AND content_type = 'linkedin') as linkedin
-           FROM articles a
-           WHERE a.status = ?
-           ORDER BY a.score DESC, a.created_at DESC""",
+        """SELECT * FROM articles
+           WHERE status = ?
+           ORDER BY score DESC, created_at DESC""",
         (status,)
     )
     return [dict(row) for row in cursor.fetchall()]
+
+
+def get_feed_cache(conn: sqlite3.Connection) -> dict[str, dict]:
+    """Get HTTP validators from the last fetch of each feed, keyed by URL."""
+    cursor = conn.execute("SELECT url, etag, last_modified, body_hash FROM feed_cache")
+    return {
+        row["url"]: {
+            "etag": row["etag"],
+            "last_modified": row["last_modified"],
+            "body_hash": row["body_hash"]
+        }
+        for row in cursor
+    }
+
+
+def save_feed_cache(conn: sqlite3.Connection, feed_cache: dict[str, dict]) -> None:
+    """Store HTTP validators for each feed."""
+    fetched_at = datetime.utcnow().isoformat()
+    conn.executemany(
+        """INSERT INTO feed_cache (url, etag, last_modified, body_hash, fetched_at)
+           VALUES (?, ?, ?, ?, ?)
+           ON CONFLICT(url) DO UPDATE SET
+               etag = excluded.etag,
+               last_modified = excluded.last_modified,
+               body_hash = excluded.body_hash,
+               fetched_at = excluded.fetched_at""",
+        [
+            (url, entry.get("etag"), entry.get("last_modified"), entry.get("body_hash"), fetched_at)
+            for url, entry in feed_cache.items()
+        ]
+    )
@@ -1,14 +1,17 @@
 """RSS Feed Fetcher for Bitcoin news"""
 
+import asyncio
+import hashlib
+import html
+import re
 import feedparser
-from datetime import datetime
-from typing import Iterator
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from dataclasses import dataclass
-from dateutil import parser as date_parser
 import httpx
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Article:
     """Represents a fetched article."""
     url: str
@@ -18,17 +21,64 @@ class Article:
     published_at: str | None
 
 
-def fetch_feed(feed_url: str, timeout: int = 30) -> list[Article]:
-    """Fetch and parse a single RSS feed."""
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Some feeds need a browser user-agent
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; BitcoinContentCurator/1.0)"
+}
+
+# Keep connections open so feeds on the same host reuse them
+LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+
+async def fetch_feed_async(
+    client: httpx.AsyncClient,
+    feed_url: str,
+    feed_cache: dict[str, dict] | None = None
+) -> list[Article]:
+    """
+    Fetch and parse a single RSS feed using a shared async client.
+
+    Args:
+        client: Shared async HTTP client
+        feed_url: Feed to fetch
+        feed_cache: Validators from the last fetch, keyed by feed URL. Unchanged
+            feeds return no articles; the entry is updated after a new download.
+    """
     articles = []
 
     try:
-        # Some feeds need a browser user-agent
-        headers = {
-            "User-Agent": "Mozilla/5.0 (compatible; BitcoinContentCurator/1.0)"
-        }
-        response = httpx.get(feed_url, headers=headers, timeout=timeout, follow_redirects=True)
-        feed = feedparser.parse(response.text)
+        print(f"Fetching: {feed_url}")
+        cached = (feed_cache or {}).get(feed_url, {})
+
+        # Conditional GET, servers answer 304 with no body if the feed is unchanged
+        headers = {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = await client.get(feed_url, headers=headers)
+        if response.status_code == 304:
+            print(f"Not modified: {feed_url}")
+            return articles
+
+        # Some servers ignore validators, skip parsing if the body is identical
+        body_hash = hashlib.blake2b(response.content).hexdigest()
+        if body_hash == cached.get("body_hash"):
+            print(f"Not modified: {feed_url}")
+            return articles
+
+        # Parsing is CPU-bound, run it off the event loop so other fetches proceed
+        feed = await asyncio.to_thread(feedparser.parse, response.content)
+
+        if feed_cache is not None and response.status_code == 200:
+            feed_cache[feed_url] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "body_hash": body_hash
+            }
 
         source_name = feed.feed.get("title", feed_url)
 
@@ -48,21 +98,11 @@ def fetch_feed(feed_url: str, timeout: int = 30) -> list[Article]:
             elif "content" in entry and entry.content:
                 summary = entry.content[0].get("value", "")
 
-            # Clean up HTML from summary
-            summary = _strip_html(summary)[:1000]  # Truncate long summaries
+            # Clean up HTML from summary, truncating long summaries
+            summary = _strip_html(summary)
 
             # Parse published date
-            published_at = None
-            if "published" in entry:
-                try:
-                    published_at = date_parser.parse(entry.published).isoformat()
-                except (ValueError, TypeError):
-                    pass
-            elif "updated" in entry:
-                try:
-                    published_at = date_parser.parse(entry.updated).isoformat()
-                except (ValueError, TypeError):
-                    pass
+            published_at = _parse_date(entry)
 
             articles.append(Article(
                 url=url,
@@ -78,33 +118,73 @@ def fetch_feed(feed_url: str, timeout: int = 30) -> list[Article]:
     return articles
 
 
-def fetch_all_feeds(feed_urls: list[str]) -> Iterator[Article]:
-    """Fetch all configured RSS feeds, yield articles."""
-    seen_urls = set()
-
-    for feed_url in feed_urls:
-        print(f"Fetching: {feed_url}")
-        articles = fetch_feed(feed_url)
-
-        for article in articles:
-            # Dedupe within this run
-            if article.url not in seen_urls:
-                seen_urls.add(article.url)
-                yield article
-
-
-def _strip_html(text: str) -> str:
-    """Remove HTML tags from text."""
-    import re
-    # Remove HTML tags
-    clean = re.sub(r'<[^>]+>', ' ', text)
-    # Normalize whitespace
-    clean = re.sub(r'\s+', ' ', clean).strip()
-    # Decode common HTML entities
-    clean = clean.replace('&amp;', '&')
-    clean = clean.replace('&lt;', '<')
-    clean = clean.replace('&gt;', '>')
-    clean = clean.replace('&quot;', '"')
-    clean = clean.replace('&#39;', "'")
-    clean = clean.replace('&nbsp;', ' ')
-    return clean
+async def _fetch_all_async(
+    feed_urls: list[str],
+    feed_cache: dict[str, dict] | None = None,
+    timeout: int = 30
+) -> list[list[Article]]:
+    """Fetch all feeds concurrently, returning one article list per feed."""
+    # One pooled HTTP/2 client per run; async clients are tied to their event loop
+    async with httpx.AsyncClient(
+        http2=True,
+        headers=HEADERS,
+        limits=LIMITS,
+        timeout=timeout,
+        follow_redirects=True
+    ) as client:
+        results = await asyncio.gather(
+            *[fetch_feed_async(client, url, feed_cache) for url in feed_urls],
+            return_exceptions=True
+        )
+
+    feeds = []
+    for feed_url, result in zip(feed_urls, results):
+        if isinstance(result, BaseException):
+            print(f"Error fetching {feed_url}: {result}")
+            feeds.append([])
+        else:
+            feeds.append(result)
+    return feeds
+
+
+def fetch_all_feeds(
+    feed_urls: list[str],
+    feed_cache: dict[str, dict] | None = None
+) -> list[Article]:
+    """
+    Fetch all configured RSS feeds concurrently.
+
+    Articles are returned in feed order and may repeat across feeds; callers
+    dedupe. If feed_cache is given, feeds unchanged since the cached fetch are
+    skipped and the cache is updated in place.
+    """
+    feeds = asyncio.run(_fetch_all_async(feed_urls, feed_cache))
+    return [article for articles in feeds for article in articles]
+
+
+def _parse_date(entry) -> str | None:
+    """Get an entry's published (or updated) date as an ISO string."""
+    key = "published" if "published" in entry else "updated"
+    if key not in entry:
+        return None
+
+    # feedparser already parsed the date into a UTC struct_time
+    parsed = entry.get(f"{key}_parsed")
+    if parsed:
+        return datetime(*parsed[:6], tzinfo=timezone.utc).isoformat()
+
+    # Fall back to RFC 822 parsing of the raw string
+    try:
+        return parsedate_to_datetime(entry[key]).isoformat()
+    except (ValueError, TypeError):
+        return None
+
+
+def _strip_html(text: str, max_length: int = 1000) -> str:
+    """Remove HTML tags from text and truncate to max_length characters."""
+    # Remove HTML tags (plain-text summaries skip the regex)
+    if '<' in text:
+        text = _TAG_RE.sub(' ', text)
+    # Decode HTML entities, then normalize whitespace with C-level split/join
+    clean = ' '.join(html.unescape(text).split())
+    return clean[:max_length]
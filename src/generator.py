@@ -1,8 +1,14 @@
 """Content generation using Claude API"""
 
-import json
+import re
+import orjson
 from dataclasses import dataclass
-from anthropic import Anthropic
+from functools import lru_cache
+from anthropic import AsyncAnthropic
+
+
+# Outermost {...}, skips code fences and any text around the object
+_JSON_RE = re.compile(r'\{.*\}', re.S)
 
 
 @dataclass
@@ -13,16 +19,11 @@ class GeneratedContent:
     linkedin: str        # LinkedIn post
 
 
-GENERATION_PROMPT = """You are a Bitcoin content creator. Generate social media posts about this article.
+GENERATION_PROMPT = """You are a Bitcoin content creator. Generate social media posts about the article you are given.
 
 {style_guide}
 
-Article Title: {title}
-Article Source: {source}
-Article Summary: {summary}
-Article URL: {url}
-
-Generate three versions:
+For each article, generate three versions:
 
 1. TWEET: A single tweet (max 270 chars to leave room for link). Punchy, insightful take.
 
@@ -45,8 +46,22 @@ Respond with JSON:
 }}"""
 
 
-def generate_content(
-    client: Anthropic,
+@lru_cache(maxsize=4)
+def _build_system_prompt(style_guide: str) -> str:
+    """Fill the style guide into the system prompt, once per run."""
+    return GENERATION_PROMPT.format(style_guide=style_guide)
+
+
+def build_generation_message(title: str, source: str, summary: str, url: str) -> str:
+    """Format article details for the user message."""
+    return f"""Article Title: {title}
+Article Source: {source}
+Article Summary: {summary}
+Article URL: {url}"""
+
+
+async def generate_content(
+    client: AsyncAnthropic,
     title: str,
     summary: str,
     source: str,
@@ -56,35 +71,32 @@ def generate_content(
 ) -> GeneratedContent:
     """Generate social media content for an article."""
 
-    prompt = GENERATION_PROMPT.format(
-        title=title,
-        summary=summary,
-        source=source,
-        url=url,
-        style_guide=style_guide
-    )
+    prompt = build_generation_message(title=title, source=source, summary=summary, url=url)
 
-    response = client.messages.create(
+    async with client.messages.stream(
         model=model,
         max_tokens=1500,
+        # Style guide is fixed for the run, so it belongs in the cached prefix too
+        system=[{
+            "type": "text",
+            "text": _build_system_prompt(style_guide),
+            "cache_control": {"type": "ephemeral"}
+        }],
         messages=[{"role": "user", "content": prompt}]
-    )
-
-    text = response.content[0].text.strip()
+    ) as stream:
+        text = await stream.get_final_text()
 
-    # Handle markdown code blocks
-    if text.startswith("```"):
-        lines = text.split("\n")
-        text = "\n".join(lines[1:-1])
+    match = _JSON_RE.search(text)
+    text = match.group(0) if match else text.strip()
 
     try:
-        data = json.loads(text)
+        data = orjson.loads(text)
         return GeneratedContent(
             tweet=data.get("tweet", ""),
             thread=data.get("thread", ""),
             linkedin=data.get("linkedin", "")
         )
-    except (json.JSONDecodeError, KeyError, TypeError) as e:
+    except (orjson.JSONDecodeError, KeyError, TypeError) as e:
         print(f"Error parsing generated content: {e}")
         print(f"Response was: {text[:500]}")
         return GeneratedContent(tweet="", thread="", linkedin="")
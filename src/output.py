@@ -8,14 +8,20 @@ from typing import Optional
 class SilverBulletOutput:
     """Writes content to Silver Bullet space as markdown files."""
 
-    def __init__(self, space_path: Path):
+    def __init__(self, space_path: Path, buffered: bool = False):
         """
         Initialize with path to Silver Bullet space.
 
         Args:
             space_path: Path to the Silver Bullet space directory (e.g., ~/data/notes)
+            buffered: If True, hold entries in memory until flush() is called
         """
         self.space_path = Path(space_path).expanduser()
+        self.buffered = buffered
+        # (filepath, category, prepend) -> formatted entries, in call order
+        self._pending: dict[tuple[Path, str, bool], list[str]] = {}
+        # filepath -> byte length of the front matter header
+        self._header_lengths: dict[Path, int] = {}
         self._ensure_structure()
 
     def _ensure_structure(self) -> None:
@@ -23,11 +29,21 @@ class SilverBulletOutput:
         content_dir = self.space_path / "Content"
         content_dir.mkdir(parents=True, exist_ok=True)
 
-    def _read_existing(self, filepath: Path) -> str:
-        """Read existing file content or return empty string."""
-        if filepath.exists():
-            return filepath.read_text()
-        return ""
+    def _header_length(self, filepath: Path) -> int:
+        """Get byte length of the file's front matter header (0 if none)."""
+        if filepath not in self._header_lengths:
+            header_end = 0
+            with open(filepath, "rb") as f:
+                # Header ends after the first "---" line past the first line;
+                # lines keep their own "\n" or "\r\n" so the offset is exact
+                offset = 0
+                for i, line in enumerate(f):
+                    offset += len(line)
+                    if i > 0 and line.startswith(b"---"):
+                        header_end = offset
+                        break
+            self._header_lengths[filepath] = header_end
+        return self._header_lengths[filepath]
 
     def append_content(
         self,
@@ -80,32 +96,47 @@ class SilverBulletOutput:
             linkedin=linkedin
         )
 
-        # Read existing content
-        existing = self._read_existing(filepath)
+        if self.buffered:
+            self._pending.setdefault((filepath, category, prepend), []).append(entry)
+        else:
+            self._write_entries(filepath, category, entry, prepend)
+
+    def flush(self) -> None:
+        """Write all buffered entries, one write per file."""
+        for (filepath, category, prepend), entries in self._pending.items():
+            if prepend:
+                # Newest entry goes on top, as if each had been prepended in turn
+                entries = entries[::-1]
+            self._write_entries(filepath, category, "".join(entries), prepend)
+        self._pending.clear()
+
+    def _write_entries(
+        self,
+        filepath: Path,
+        category: str,
+        entries: str,
+        prepend: bool
+    ) -> None:
+        """Write formatted entries below the header (prepend) or at the end of the file."""
+        data = entries.encode()
 
-        # Add header if file is new
-        if not existing:
-            header = self._get_header(category)
-            existing = header
+        # Add header if file is new or empty
+        if not filepath.exists() or filepath.stat().st_size == 0:
+            header = self._get_header(category).encode()
+            filepath.write_bytes(header + data.lstrip(b"\n"))
+            return
 
-        # Prepend or append
         if prepend:
-            # Find where content starts (after header)
-            lines = existing.split("\n")
-            header_end = 0
-            for i, line in enumerate(lines):
-                if line.startswith("---") and i > 0:
-                    header_end = i + 1
-                    break
-
-            header_part = "\n".join(lines[:header_end])
-            content_part = "\n".join(lines[header_end:])
-
-            new_content = f"{header_part}\n{entry}\n{content_part}"
+            # Only the bytes after the header move; nothing is decoded
+            header_end = self._header_length(filepath)
+            with open(filepath, "r+b") as f:
+                f.seek(header_end)
+                rest = f.read()
+                f.seek(header_end)
+                f.write(data + rest)
         else:
-            new_content = f"{existing}\n{entry}"
-
-        filepath.write_text(new_content.strip() + "\n")
+            with open(filepath, "ab") as f:
+                f.write(data)
 
     def _get_header(self, category: str) -> str:
         """Get markdown header for category file."""
@@ -167,29 +198,3 @@ tags: #content #bitcoin
         entry += "\n---\n"
         return entry
 
-
-def write_to_silverbullet(
-    space_path: str,
-    category: str,
-    title: str,
-    url: str,
-    source: str,
-    score: float,
-    score_reason: str,
-    tweet: Optional[str] = None,
-    thread: Optional[str] = None,
-    linkedin: Optional[str] = None
-) -> None:
-    """Convenience function to write content to Silver Bullet."""
-    output = SilverBulletOutput(space_path)
-    output.append_content(
-        category=category,
-        title=title,
-        url=url,
-        source=source,
-        score=score,
-        score_reason=score_reason,
-        tweet=tweet,
-        thread=thread,
-        linkedin=linkedin
-    )
@@ -1,19 +1,124 @@
 """Main content curation pipeline"""
 
-from anthropic import Anthropic
+import asyncio
+from anthropic import (
+    AsyncAnthropic,
+    APIError,
+    APIStatusError,
+    APIConnectionError,
+    RateLimitError
+)
 from pathlib import Path
 
 from .fetcher import fetch_all_feeds, Article
-from .scorer import score_article
-from .generator import generate_content
+from .scorer import score_article, ScoreResult
+from .generator import generate_content, GeneratedContent
 from .database import (
     get_connection,
-    article_exists,
-    insert_article,
-    update_score,
-    insert_content
+    get_existing_urls,
+    insert_articles_bulk,
+    get_feed_cache,
+    save_feed_cache
 )
-from .output import write_to_silverbullet
+from .output import SilverBulletOutput
+
+
+# Max in-flight Claude requests, keeps us under API rate limits
+MAX_CONCURRENT_REQUESTS = 8
+
+# Error types the API reports for temporary server-side problems
+TRANSIENT_ERROR_TYPES = ("overloaded_error", "api_error", "rate_limit_error")
+
+
+async def _bounded(semaphore: asyncio.Semaphore, coro):
+    """Await a coroutine while holding the semaphore."""
+    async with semaphore:
+        return await coro
+
+
+def _is_transient(error: APIError) -> bool:
+    """Check whether a failed API call is worth retrying on the next run."""
+    if isinstance(error, (RateLimitError, APIConnectionError)):
+        return True
+    if isinstance(error, APIStatusError):
+        # Errors sent mid-stream carry the stream's 200 status, check the body too
+        body = error.body if isinstance(error.body, dict) else {}
+        error_type = (body.get("error") or {}).get("type")
+        return error.status_code >= 500 or error_type in TRANSIENT_ERROR_TYPES
+    return False
+
+
+async def _score_and_generate(
+    api_key: str,
+    articles: list[Article],
+    model: str,
+    style_guide: str,
+    score_medium: float
+) -> list[tuple[ScoreResult | None, GeneratedContent | None, APIError | None]]:
+    """
+    Score all articles concurrently, then generate content for those that pass.
+
+    Returns:
+        (score, generated content, error) per article, in article order. Score and
+        content are None if not produced; error is set if an API call failed.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async with AsyncAnthropic(api_key=api_key) as client:
+        print(f"\nScoring {len(articles)} articles...")
+        scores = await asyncio.gather(*[
+            _bounded(semaphore, score_article(
+                client=client,
+                title=article.title,
+                summary=article.summary,
+                source=article.source,
+                model=model
+            ))
+            for article in articles
+        ], return_exceptions=True)
+
+        results = []
+        for article, score_result in zip(articles, scores):
+            if isinstance(score_result, APIError):
+                print(f"Error scoring {article.url}: {score_result}")
+                results.append((None, None, score_result))
+            elif isinstance(score_result, BaseException):
+                # Not an API failure, a bug; nothing has been stored yet
+                raise score_result
+            else:
+                results.append((score_result, None, None))
+
+        # Generate content for high and medium scores
+        to_generate = [
+            i for i, (score_result, _, _) in enumerate(results)
+            if score_result is not None
+            and score_result.score >= score_medium
+            and score_result.is_bitcoin_relevant
+        ]
+        print(f"Generating content for {len(to_generate)} articles...")
+        generated = await asyncio.gather(*[
+            _bounded(semaphore, generate_content(
+                client=client,
+                title=articles[i].title,
+                summary=articles[i].summary,
+                source=articles[i].source,
+                url=articles[i].url,
+                style_guide=style_guide,
+                model=model
+            ))
+            for i in to_generate
+        ], return_exceptions=True)
+
+    for i, content in zip(to_generate, generated):
+        if isinstance(content, APIError):
+            print(f"Error generating content for {articles[i].url}: {content}")
+            results[i] = (results[i][0], None, content)
+        elif isinstance(content, BaseException):
+            raise content
+        else:
+            results[i] = (results[i][0], content, None)
+
+    return results
 
 
 def run_pipeline(
@@ -39,6 +144,8 @@ def run_pipeline(
         "new": 0,
         "skipped_duplicate": 0,
         "scored": 0,
+        "failed": 0,
+        "retry": 0,
         "generated": 0,
         "ready": 0,
         "review": 0,
@@ -46,48 +153,75 @@ def run_pipeline(
     }
 
     # Initialize
-    client = Anthropic(api_key=api_key)
     conn = get_connection(db_path)
 
     print(f"Fetching articles from {len(feeds)} feeds...")
 
-    processed = 0
-    for article in fetch_all_feeds(feeds):
-        stats["fetched"] += 1
+    # Collect new articles before calling Claude so requests can run concurrently
+    feed_cache = get_feed_cache(conn)
+    articles = fetch_all_feeds(feeds, feed_cache)
+    stats["fetched"] = len(articles)
+
+    # Look up every fetched URL in one query instead of one per article,
+    # then keep adding to the set to dedupe articles listed by several feeds
+    seen_urls = get_existing_urls(conn, [article.url for article in articles])
 
-        # Check if already processed
-        if article_exists(conn, article.url):
+    new_articles = []
+    truncated = False
+    for article in articles:
+        # Check if already processed (or already seen this run)
+        if article.url in seen_urls:
             stats["skipped_duplicate"] += 1
             continue
+        seen_urls.add(article.url)
 
         stats["new"] += 1
 
         # Respect max articles limit
-        if processed >= max_articles:
+        if len(new_articles) >= max_articles:
             print(f"Reached max articles limit ({max_articles})")
+            truncated = True
             break
 
-        processed += 1
-        print(f"\n[{processed}] Processing: {article.title[:60]}...")
-
-        # Insert article
-        article_id = insert_article(
-            conn,
-            url=article.url,
-            title=article.title,
-            source=article.source,
-            published_at=article.published_at
-        )
-
-        # Score the article
-        print("  Scoring...")
-        score_result = score_article(
-            client=client,
-            title=article.title,
-            summary=article.summary,
-            source=article.source,
-            model=model
-        )
+        new_articles.append(article)
+
+    results = asyncio.run(_score_and_generate(
+        api_key=api_key,
+        articles=new_articles,
+        model=model,
+        style_guide=style_guide,
+        score_medium=score_medium
+    ))
+
+    # Transient failures are not stored, so the next run retries them. Permanent
+    # ones are stored as failed so they aren't re-scored (and billed) every run
+    processed_articles = []
+    rows = []
+    for article, (score_result, content, error) in zip(new_articles, results):
+        if error is None:
+            processed_articles.append((article, score_result, content))
+        elif _is_transient(error):
+            stats["retry"] += 1
+        else:
+            stats["failed"] += 1
+            rows.append({
+                "url": article.url,
+                "title": article.title,
+                "source": article.source,
+                "published_at": article.published_at,
+                "score": score_result.score if score_result else None,
+                "score_reason": f"{type(error).__name__}: {error}",
+                "status": "failed",
+                "tweet": None,
+                "thread": None,
+                "linkedin": None
+            })
+
+    # Buffer Silver Bullet entries so each file is written once
+    output = None if dry_run else SilverBulletOutput(silverbullet_space, buffered=True)
+
+    for processed, (article, score_result, content) in enumerate(processed_articles, start=1):
+        print(f"\n[{processed}] {article.title[:60]}...")
         stats["scored"] += 1
 
         print(f"  Score: {score_result.score}/10 - {score_result.reason[:50]}...")
@@ -106,41 +240,31 @@ def run_pipeline(
             status = "archived"
             stats["archive"] += 1
 
-        # Update score in database
-        update_score(conn, article_id, score_result.score, score_result.reason, status)
-
-        # Generate content for high and medium scores
         tweet = thread = linkedin = None
-        if score_result.score >= score_medium and score_result.is_bitcoin_relevant:
-            print("  Generating content...")
-            content = generate_content(
-                client=client,
-                title=article.title,
-                summary=article.summary,
-                source=article.source,
-                url=article.url,
-                style_guide=style_guide,
-                model=model
-            )
+        if content is not None:
             stats["generated"] += 1
 
             tweet = content.tweet
             thread = content.thread
             linkedin = content.linkedin
 
-            # Store in database
-            if tweet:
-                insert_content(conn, article_id, "tweet", tweet)
-            if thread:
-                insert_content(conn, article_id, "thread", thread)
-            if linkedin:
-                insert_content(conn, article_id, "linkedin", linkedin)
+        rows.append({
+            "url": article.url,
+            "title": article.title,
+            "source": article.source,
+            "published_at": article.published_at,
+            "score": score_result.score,
+            "score_reason": score_result.reason,
+            "status": status,
+            "tweet": tweet or None,
+            "thread": thread or None,
+            "linkedin": linkedin or None
+        })
 
         # Write to Silver Bullet
-        if not dry_run:
+        if output is not None:
             print(f"  Writing to Silver Bullet ({category})...")
-            write_to_silverbullet(
-                space_path=silverbullet_space,
+            output.append_content(
                 category=category,
                 title=article.title,
                 url=article.url,
@@ -154,6 +278,18 @@ def run_pipeline(
         else:
             print(f"  [DRY RUN] Would write to {category}")
 
+    # Store results in a single transaction, one INSERT per article
+    with conn:
+        insert_articles_bulk(conn, rows)
+
+        # Leftover and retryable articles are only picked up if their feeds are
+        # downloaded again
+        if not truncated and not stats["retry"]:
+            save_feed_cache(conn, feed_cache)
+
+    if output is not None:
+        output.flush()
+
     conn.close()
 
     print("\n" + "=" * 50)
@@ -161,6 +297,8 @@ def run_pipeline(
     print(f"  Fetched: {stats['fetched']} articles")
     print(f"  New: {stats['new']} (skipped {stats['skipped_duplicate']} duplicates)")
     print(f"  Scored: {stats['scored']}")
+    print(f"  Failed: {stats['failed']}")
+    print(f"  Retrying next run: {stats['retry']}")
     print(f"  Generated content for: {stats['generated']}")
     print(f"  Ready to post: {stats['ready']}")
     print(f"  Needs review: {stats['review']}")
@@ -1,8 +1,13 @@
 """Article scoring using Claude API"""
 
-import json
+import re
+import orjson
 from dataclasses import dataclass
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
+
+
+# Outermost {...}, skips code fences and any text around the object
+_JSON_RE = re.compile(r'\{.*\}', re.S)
 
 
 @dataclass
@@ -15,7 +20,7 @@ class ScoreResult:
 
 SCORING_PROMPT = """You are evaluating articles for a Bitcoin-focused content curator.
 
-Rate this article on a scale of 1-10 based on:
+Rate the article on a scale of 1-10 based on:
 - Bitcoin relevance (is it specifically about Bitcoin, not general crypto?)
 - Newsworthiness (is this significant/interesting news?)
 - Educational value (does it explain something useful?)
@@ -34,20 +39,25 @@ Boost:
 - Educational deep-dives on Bitcoin concepts
 - Original analysis or research
 
-Article Title: {title}
-Article Source: {source}
-Article Summary: {summary}
-
 Respond with JSON only:
-{{
+{
     "score": <1-10>,
     "reason": "<brief explanation>",
     "is_bitcoin_relevant": <true/false>
-}}"""
+}"""
 
 
-def score_article(
-    client: Anthropic,
+def build_scoring_message(title: str, source: str, summary: str) -> str:
+    """Build the user message for one article."""
+    return f"""Article Title: {title}
+Article Source: {source}
+Article Summary: {summary}
+
+Respond with JSON only."""
+
+
+async def score_article(
+    client: AsyncAnthropic,
     title: str,
     summary: str,
     source: str,
@@ -55,34 +65,45 @@ def score_article(
 ) -> ScoreResult:
     """Score an article using Claude."""
 
-    prompt = SCORING_PROMPT.format(
-        title=title,
-        summary=summary,
-        source=source
-    )
+    prompt = build_scoring_message(title=title, source=source, summary=summary)
 
-    response = client.messages.create(
+    # Stream the response so we can stop as soon as the JSON object is complete
+    text = ""
+    async with client.messages.stream(
         model=model,
         max_tokens=256,
+        # Same for every article, let the API reuse the cached prefix
+        system=[{
+            "type": "text",
+            "text": SCORING_PROMPT,
+            "cache_control": {"type": "ephemeral"}
+        }],
         messages=[{"role": "user", "content": prompt}]
-    )
+    ) as stream:
+        async for delta in stream.text_stream:
+            text += delta
+            if "}" in delta:
+                match = _JSON_RE.search(text)
+                if match is None:
+                    continue
+                try:
+                    orjson.loads(match.group(0))
+                except orjson.JSONDecodeError:
+                    continue
+                break
 
     # Parse JSON response
-    text = response.content[0].text.strip()
-
-    # Handle markdown code blocks
-    if text.startswith("```"):
-        lines = text.split("\n")
-        text = "\n".join(lines[1:-1])
+    match = _JSON_RE.search(text)
+    text = match.group(0) if match else text.strip()
 
     try:
-        data = json.loads(text)
+        data = orjson.loads(text)
         return ScoreResult(
             score=float(data.get("score", 1)),
             reason=data.get("reason", "No reason provided"),
             is_bitcoin_relevant=data.get("is_bitcoin_relevant", False)
         )
-    except (json.JSONDecodeError, KeyError, TypeError) as e:
+    except (orjson.JSONDecodeError, KeyError, TypeError) as e:
         print(f"Error parsing score response: {e}")
         print(f"Response was: {text}")
         return ScoreResult(score=1, reason="Failed to parse", is_bitcoin_relevant=False)